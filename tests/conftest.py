@@ -1,7 +1,11 @@
 """
 Pytest configuration and fixtures for testing the FastAPI application.
 """
+import copy
+import httpx
+import orjson
 import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
 import sys
 from pathlib import Path
@@ -9,46 +13,70 @@ from pathlib import Path
 # Add src directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from app import app, activities
+from app import create_app, DEFAULT_ACTIVITIES
 
 
-@pytest.fixture
+def _cached_json(self, **kwargs):
+    """Parse the response body with orjson once and reuse the result."""
+    if kwargs:
+        raise TypeError(f"orjson does not support json.loads options: {sorted(kwargs)}")
+    if "_cached_json" not in self.__dict__:
+        self.__dict__["_cached_json"] = orjson.loads(self.content)
+    return self.__dict__["_cached_json"]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def orjson_responses():
+    """Parse response bodies with orjson instead of the stdlib json module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(httpx.Response, "json", _cached_json)
+        yield
+
+
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client for the FastAPI app."""
-    return TestClient(app)
+    """Create a test client for a fresh app, shared across the session.
+
+    Each pytest-xdist worker builds its own app, so workers never share
+    the in-memory activities database.
+    """
+    return TestClient(create_app())
+
+
+@pytest.fixture(scope="session", autouse=True)
+def baseline_sanity(client):
+    """Check once that the app serves the default Chess Club participants.
+
+    The unregister tests rely on two of them being signed up from the start.
+    """
+    defaults = DEFAULT_ACTIVITIES["Chess Club"]["participants"]
+    assert len(defaults) >= 2
+    data = client.get("/activities").json()
+    assert set(defaults) <= set(data["Chess Club"]["participants"])
+
+
+@pytest_asyncio.fixture
+async def async_client(client):
+    """Create an async client for the same app as the test client."""
+    transport = httpx.ASGITransport(app=client.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.fixture
+def activities(client):
+    """The in-memory activities database of the app under test."""
+    return client.app.state.activities
 
 
 @pytest.fixture(autouse=True)
-def reset_activities():
+def reset_activities(activities):
     """Reset activities data before each test."""
-    # Store original state
-    original_activities = {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        }
-    }
-    
-    # Reset activities to original state
     activities.clear()
-    activities.update(original_activities)
+    activities.update(copy.deepcopy(DEFAULT_ACTIVITIES))
     
     yield
     
     # Clean up after test
     activities.clear()
-    activities.update(original_activities)
+    activities.update(copy.deepcopy(DEFAULT_ACTIVITIES))
@@ -2,7 +2,28 @@
 Tests for the High School Management System API.
 Tests cover all endpoints: root redirect, activities listing, signup, and unregister.
 """
+import asyncio
 import pytest
+from pytest_check import check
+
+from app import DEFAULT_ACTIVITIES
+
+# Participants Chess Club starts with
+DEFAULT_CHESS = tuple(DEFAULT_ACTIVITIES["Chess Club"]["participants"])
+
+# Fields every activity must expose
+REQUIRED_FIELDS = frozenset(("description", "schedule", "max_participants", "participants"))
+
+# URL templates for the per-activity endpoints; the email goes in params
+SIGNUP = "/activities/{}/signup"
+UNREGISTER = "/activities/{}/unregister"
+
+
+def _assert_in(email, participants):
+    """Fail unless email is in participants."""
+    __tracebackhide__ = True
+    if email not in participants:
+        pytest.fail(f"{email} not in {participants!r}")
 
 
 class TestRootEndpoint:
@@ -10,7 +31,13 @@ class TestRootEndpoint:
     
     def test_root_redirects_to_static_index(self, client):
         """Test that root path redirects to /static/index.html."""
-        response = client.get("/", follow_redirects=False)
+        route = next(
+            (r for r in client.app.router.routes
+             if getattr(r, "path", None) == "/" and "GET" in getattr(r, "methods", ())),
+            None,
+        )
+        assert route is not None
+        response = route.endpoint()
         assert response.status_code == 307
         assert response.headers["location"] == "/static/index.html"
 
@@ -35,11 +62,8 @@ class TestGetActivities:
         data = response.json()
         
         for activity_name, details in data.items():
-            assert "description" in details
-            assert "schedule" in details
-            assert "max_participants" in details
-            assert "participants" in details
-            assert isinstance(details["participants"], list)
+            assert REQUIRED_FIELDS <= details.keys()
+            assert type(details["participants"]) is list
     
     def test_get_activities_includes_default_activities(self, client):
         """Test that default activities are present."""
@@ -57,7 +81,7 @@ class TestSignupForActivity:
     def test_signup_success(self, client):
         """Test successful signup for an activity."""
         response = client.post(
-            "/activities/Chess Club/signup?email=newstudent@mergington.edu"
+            SIGNUP.format("Chess Club"), params={"email": "newstudent@mergington.edu"}
         )
         assert response.status_code == 200
         data = response.json()
@@ -68,50 +92,36 @@ class TestSignupForActivity:
     def test_signup_adds_participant(self, client):
         """Test that signup actually adds participant to the list."""
         email = "teststudent@mergington.edu"
-        client.post(f"/activities/Chess Club/signup?email={email}")
+        client.post(SIGNUP.format("Chess Club"), params={"email": email})
         
         # Verify participant was added
         response = client.get("/activities")
         data = response.json()
-        assert email in data["Chess Club"]["participants"]
+        _assert_in(email, data["Chess Club"]["participants"])
     
-    def test_signup_duplicate_fails(self, client):
+    def test_signup_duplicate_fails(self, client, activities):
         """Test that signing up twice for same activity fails."""
         email = "duplicate@mergington.edu"
-        
-        # First signup should succeed
-        response1 = client.post(f"/activities/Chess Club/signup?email={email}")
-        assert response1.status_code == 200
-        
-        # Second signup should fail
-        response2 = client.post(f"/activities/Chess Club/signup?email={email}")
-        assert response2.status_code == 400
-        data = response2.json()
-        assert "already signed up" in data["detail"].lower()
-    
-    def test_signup_nonexistent_activity_fails(self, client):
-        """Test that signing up for non-existent activity fails."""
-        response = client.post(
-            "/activities/Nonexistent Club/signup?email=test@mergington.edu"
-        )
-        assert response.status_code == 404
-        data = response.json()
-        assert "not found" in data["detail"].lower()
-    
+
+        # Seed the first signup directly instead of via the API
+        activities["Chess Club"]["participants"].append(email)
+
+        response = client.post(SIGNUP.format("Chess Club"), params={"email": email})
+        assert response.status_code == 400
+        assert "already signed up" in response.json()["detail"].lower()
+
     def test_signup_existing_participants_unchanged(self, client):
         """Test that existing participants remain after new signup."""
         response = client.get("/activities")
-        original_participants = response.json()["Chess Club"]["participants"].copy()
+        original = set(response.json()["Chess Club"]["participants"])
         
         # Add new participant
-        client.post("/activities/Chess Club/signup?email=newperson@mergington.edu")
+        client.post(SIGNUP.format("Chess Club"), params={"email": "newperson@mergington.edu"})
         
         # Check original participants are still there
         response = client.get("/activities")
-        current_participants = response.json()["Chess Club"]["participants"]
-        
-        for participant in original_participants:
-            assert participant in current_participants
+        current = set(response.json()["Chess Club"]["participants"])
+        assert original <= current
 
 
 class TestUnregisterFromActivity:
@@ -119,103 +129,93 @@ class TestUnregisterFromActivity:
     
     def test_unregister_success(self, client):
         """Test successful unregistration from an activity."""
-        # Chess Club has michael@mergington.edu by default
-        response = client.delete(
-            "/activities/Chess Club/unregister?email=michael@mergington.edu"
-        )
+        email = DEFAULT_CHESS[0]
+        response = client.delete(UNREGISTER.format("Chess Club"), params={"email": email})
         assert response.status_code == 200
         data = response.json()
         assert "message" in data
-        assert "michael@mergington.edu" in data["message"]
+        assert email in data["message"]
         assert "Chess Club" in data["message"]
     
     def test_unregister_removes_participant(self, client):
         """Test that unregister actually removes participant from the list."""
-        email = "michael@mergington.edu"
-        
-        # Verify participant exists
-        response = client.get("/activities")
-        assert email in response.json()["Chess Club"]["participants"]
+        email = DEFAULT_CHESS[0]
         
         # Unregister
-        client.delete(f"/activities/Chess Club/unregister?email={email}")
+        response = client.delete(UNREGISTER.format("Chess Club"), params={"email": email})
+        assert response.status_code == 200
         
         # Verify participant was removed
         response = client.get("/activities")
         assert email not in response.json()["Chess Club"]["participants"]
     
-    def test_unregister_not_signed_up_fails(self, client):
-        """Test that unregistering when not signed up fails."""
-        response = client.delete(
-            "/activities/Chess Club/unregister?email=notregistered@mergington.edu"
-        )
-        assert response.status_code == 400
-        data = response.json()
-        assert "not signed up" in data["detail"].lower()
-    
-    def test_unregister_nonexistent_activity_fails(self, client):
-        """Test that unregistering from non-existent activity fails."""
-        response = client.delete(
-            "/activities/Nonexistent Club/unregister?email=test@mergington.edu"
-        )
-        assert response.status_code == 404
-        data = response.json()
-        assert "not found" in data["detail"].lower()
-    
     def test_unregister_other_participants_unchanged(self, client):
         """Test that other participants remain after one unregisters."""
-        # Chess Club has michael and daniel by default
-        client.delete("/activities/Chess Club/unregister?email=michael@mergington.edu")
+        removed, remaining = DEFAULT_CHESS
+        response = client.delete(UNREGISTER.format("Chess Club"), params={"email": removed})
+        assert response.status_code == 200
         
-        # Check daniel is still there
+        # Check the other default participant is still there
         response = client.get("/activities")
-        participants = response.json()["Chess Club"]["participants"]
-        assert "daniel@mergington.edu" in participants
-        assert "michael@mergington.edu" not in participants
+        _assert_in(remaining, response.json()["Chess Club"]["participants"])
+
+
+class TestErrorCases:
+    """Tests for signup and unregister error responses."""
+
+    testdata = [
+        ("POST", SIGNUP.format("Nonexistent Club"), "test@mergington.edu",
+         404, "not found"),
+        ("POST", SIGNUP.format("Chess Club"), "michael@mergington.edu",
+         400, "already signed up"),
+        ("DELETE", UNREGISTER.format("Nonexistent Club"), "test@mergington.edu",
+         404, "not found"),
+        ("DELETE", UNREGISTER.format("Chess Club"), "notregistered@mergington.edu",
+         400, "not signed up"),
+    ]
+
+    @pytest.mark.parametrize("method,path,email,status,detail", testdata)
+    def test_error_cases(self, client, method, path, email, status, detail):
+        """Test that invalid signup/unregister requests fail with a clear detail."""
+        response = client.request(method, path, params={"email": email})
+        assert response.status_code == status
+        assert detail in response.json()["detail"].lower()
 
 
 class TestIntegrationScenarios:
     """Integration tests for complete user flows."""
     
-    def test_signup_and_unregister_flow(self, client):
-        """Test complete flow of signing up and then unregistering."""
-        email = "flowtest@mergington.edu"
+    @pytest.mark.asyncio
+    async def test_full_user_journey(self, async_client):
+        """Test signing up and unregistering, then joining several activities."""
+        email = "journey@mergington.edu"
         activity = "Programming Class"
         
-        # Get initial participant count
-        response = client.get("/activities")
-        initial_count = len(response.json()[activity]["participants"])
-        
-        # Sign up
-        response = client.post(f"/activities/{activity}/signup?email={email}")
-        assert response.status_code == 200
-        
-        # Verify count increased
-        response = client.get("/activities")
-        assert len(response.json()[activity]["participants"]) == initial_count + 1
-        assert email in response.json()[activity]["participants"]
-        
-        # Unregister
-        response = client.delete(f"/activities/{activity}/unregister?email={email}")
-        assert response.status_code == 200
-        
-        # Verify count back to original
-        response = client.get("/activities")
-        assert len(response.json()[activity]["participants"]) == initial_count
-        assert email not in response.json()[activity]["participants"]
-    
-    def test_multiple_signups_different_activities(self, client):
-        """Test that a student can sign up for multiple different activities."""
-        email = "multisport@mergington.edu"
-        
-        # Sign up for multiple activities
-        activities = ["Chess Club", "Programming Class", "Gym Class"]
-        for activity in activities:
-            response = client.post(f"/activities/{activity}/signup?email={email}")
-            assert response.status_code == 200
+        # Get initial participants
+        response = await async_client.get("/activities")
+        baseline = response.json()[activity]["participants"]
+        
+        # Sign up, then unregister (only succeeds if the signup was recorded)
+        response = await async_client.post(SIGNUP.format(activity), params={"email": email})
+        check.equal(response.status_code, 200)
+        response = await async_client.delete(UNREGISTER.format(activity), params={"email": email})
+        check.equal(response.status_code, 200)
+        
+        # Verify participants back to original
+        response = await async_client.get("/activities")
+        check.equal(response.json()[activity]["participants"], baseline)
+        
+        # Sign up for multiple activities concurrently
+        journey_activities = ["Chess Club", "Programming Class", "Gym Class"]
+        results = await asyncio.gather(*[
+            async_client.post(SIGNUP.format(name), params={"email": email})
+            for name in journey_activities
+        ])
+        for result in results:
+            check.equal(result.status_code, 200)
         
         # Verify student is in all activities
-        response = client.get("/activities")
+        response = await async_client.get("/activities")
         data = response.json()
-        for activity in activities:
-            assert email in data[activity]["participants"]
+        for name in journey_activities:
+            check.is_in(email, data[name]["participants"])